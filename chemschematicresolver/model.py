@@ -20,6 +20,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 import logging
+import math
 
 from . import decorators
 import numpy as np
@@ -31,6 +32,8 @@ log = logging.getLogger(__name__)
 class Rect(object):
     """A rectangular region."""
 
+    __slots__ = ('left', 'right', 'top', 'bottom')
+
     def __init__(self, left, right, top, bottom):
         """
 
@@ -66,7 +69,7 @@ class Rect(object):
 
         :rtype: int
         """
-        return (2 * self.height) + (2 * self.width)
+        return 2 * (self.height + self.width)
 
     @property
     def area(self):
@@ -93,7 +96,7 @@ class Rect(object):
         :rtype: tuple(int, int)
         """
         xcenter, ycenter = self.center
-        return np.around(xcenter), np.around(ycenter)
+        return round(xcenter), round(ycenter)
 
     def contains(self, other_rect):
         """Return true if ``other_rect`` is within this rect.
@@ -112,8 +115,16 @@ class Rect(object):
         :return: Whether ``other_rect`` overlaps this rect.
         :rtype: bool
         """
-        return (min(self.right, other_rect.right) > max(self.left, other_rect.left) and
-                min(self.bottom, other_rect.bottom) > max(self.top, other_rect.top))
+        if self.right <= other_rect.left or other_rect.right <= self.left:
+            return False
+        if self.bottom <= other_rect.top or other_rect.bottom <= self.top:
+            return False
+        # Rectangles with no width or height overlap nothing
+        if self.right <= self.left or other_rect.right <= other_rect.left:
+            return False
+        if self.bottom <= self.top or other_rect.bottom <= other_rect.top:
+            return False
+        return True
 
     def separation(self, other_rect):
         """ Returns the distance between the center of each graph
@@ -122,9 +133,9 @@ class Rect(object):
         :return: Distance between centoids of rectangle
         :rtype: float
         """
-        length = abs(self.center[0] - other_rect.center[0])
-        height = abs(self.center[1] - other_rect.center[1])
-        return np.hypot(length, height)
+        xcenter, ycenter = self.center
+        other_xcenter, other_ycenter = other_rect.center
+        return math.hypot(xcenter - other_xcenter, ycenter - other_ycenter)
 
 
     def __repr__(self):
@@ -149,20 +160,14 @@ class Rect(object):
 class Panel(Rect):
     """ Tagged section inside Figure"""
 
+    __slots__ = ('tag', 'repeating', '_pixel_ratio')
+
     def __init__(self, left, right, top, bottom, tag=0):
         super(Panel, self).__init__(left, right, top, bottom)
         self.tag = tag
-        self._repeating = False
+        self.repeating = False
         self._pixel_ratio = None
 
-    @property
-    def repeating(self):
-        return self._repeating
-
-    @repeating.setter
-    def repeating(self, repeating):
-        self._repeating = repeating
-
     @property
     def pixel_ratio(self):
         return self._pixel_ratio
@@ -175,6 +180,8 @@ class Panel(Rect):
 class Diagram(Panel):
     """ Chemical Schematic Diagram that is identified"""
 
+    __slots__ = ('_label', '_smile', '_fig')
+
     def __init__(self, *args, label=None, smile=None, fig=None):
         self._label = label
         self._smile = smile
@@ -209,8 +216,10 @@ class Diagram(Panel):
     def compass_position(self, other):
         """ Determines the compass position (NSEW) of other relative to self"""
 
-        length = other.center[0] - self.center[0]
-        height = other.center[1] - self.center[1]
+        xcenter, ycenter = self.center
+        other_xcenter, other_ycenter = other.center
+        length = other_xcenter - xcenter
+        height = other_ycenter - ycenter
 
         if abs(length) > abs(height):
             if length > 0:
@@ -246,9 +255,11 @@ class Diagram(Panel):
 class Label(Panel):
     """ Label used as an identifier for the closest Chemical Schematic Diagram"""
 
+    __slots__ = ('_r_group', 'values', '_text')
+
     def __init__(self, *args):
         super(Label, self).__init__(*args)
-        self.r_group = []
+        self._r_group = []
         self.values = []
 
     @property
@@ -259,13 +270,14 @@ class Label(Panel):
     def text(self, text):
         self._text = text
 
+    @property
     def r_group(self):
         """ List of lists of tuples containing variable-value-label triplets.
             Each list represents a particular combination of chemicals yielding a unique compound.
 
             :param : List(str,str,List(str)) : A list of variable-value pairs and their list of candidate labels
         """
-        return self.r_group
+        return self._r_group
 
     def add_r_group_variables(self, var_value_label_tuples):
         """ Updates the R-groups for this label."""
@@ -310,8 +322,8 @@ class Figure(object):
         :param list[Photo] photos: List of photos.
         """
         self.img = img
-        self.width, self.height = img.shape[0], img.shape[1]
-        self.center = (int(self.width * 0.5), int(self.height) * 0.5)
+        self.height, self.width = img.shape[:2]
+        self.center = (self.width >> 1, self.height >> 1)
         self.panels = panels
         self.plots = plots
         self.photos = photos
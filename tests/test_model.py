@@ -14,6 +14,7 @@ from __future__ import unicode_literals
 import logging
 
 import chemschematicresolver.model as mod
+import numpy as np
 import unittest
 
 log = logging.getLogger(__name__)
@@ -38,3 +39,39 @@ class TestModel(unittest.TestCase):
         list1 = [tuple1, tuple2]
 
         self.assertTrue(tuple1 in list1)
+
+    def test_panel_repeating(self):
+        p1 = mod.Panel(1, 2, 3, 4, 0)
+        self.assertFalse(p1.repeating)
+        p1.repeating = True
+        self.assertTrue(p1.repeating)
+
+    def test_label_r_group(self):
+        label = mod.Label(1, 2, 3, 4, 0)
+        self.assertEqual(label.r_group, [])
+        label.add_r_group_variables([('R', 'H', ['1'])])
+        self.assertEqual(label.r_group, [[('R', 'H', ['1'])]])
+
+    def test_compass_position(self):
+        d1 = mod.Diagram(0, 10, 0, 10, 0)
+        self.assertEqual(d1.compass_position(mod.Rect(20, 30, 0, 10)), 'E')
+        self.assertEqual(d1.compass_position(mod.Rect(-30, -20, 0, 10)), 'W')
+        self.assertEqual(d1.compass_position(mod.Rect(0, 10, 20, 30)), 'S')
+        self.assertEqual(d1.compass_position(mod.Rect(0, 10, -30, -20)), 'N')
+
+    def test_center_px(self):
+        r1 = mod.Rect(0, 3, 0, 6)
+        self.assertEqual(r1.center_px, (2, 3))
+
+    def test_overlaps(self):
+        r1 = mod.Rect(0, 10, 0, 10)
+        self.assertTrue(r1.overlaps(mod.Rect(5, 15, 5, 15)))
+        self.assertFalse(r1.overlaps(mod.Rect(10, 20, 0, 10)))
+        self.assertFalse(r1.overlaps(mod.Rect(0, 10, 20, 30)))
+        self.assertFalse(r1.overlaps(mod.Rect(5, 5, 0, 10)))
+
+    def test_figure_dimensions(self):
+        fig = mod.Figure(np.zeros((20, 31, 3)))
+        self.assertEqual(fig.width, 31)
+        self.assertEqual(fig.height, 20)
+        self.assertEqual(fig.center, (15, 10))